@@ -0,0 +1,38 @@
+"""
+Настройки обработки сценариев
+Читаются из .env один раз при импорте модуля
+"""
+
+import os
+from dotenv import load_dotenv
+
+load_dotenv(dotenv_path='.env')
+
+
+def _get_bool(name: str, default: bool = False) -> bool:
+    """
+    Чтение логического флага из переменных окружения
+
+    Args:
+        name: Имя переменной
+        default: Значение, если переменная не задана
+
+    Returns:
+        True для значений 1/true/yes, иначе False
+    """
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ('1', 'true', 'yes')
+
+
+# Путь к файлу сценария
+SCRIPT_FILE: str = os.getenv('SCRIPT_FILE', '')
+
+# Настройки вывода
+OUTPUT_FORMAT: str = os.getenv('OUTPUT_FORMAT', 'both')
+OUTPUT_DIR: str = os.getenv('OUTPUT_DIR', 'processed')
+
+# Настройки обработки
+ENABLE_LOGGING: bool = _get_bool('ENABLE_LOGGING')
+VERBOSE_OUTPUT: bool = _get_bool('VERBOSE_OUTPUT')
@@ -1,12 +1,13 @@
 # Команды для установки зависимостей script_loader.py
 
 # 1. Установить основные библиотеки:
+pip install PyMuPDF==1.26.5
 pip install PyPDF2==3.0.1
 pip install pdfplumber==0.10.3
 pip install python-docx==1.1.0
 pip install python-docx
-# 2. Опционально (для временных меток):
-pip install pandas>=1.5.0
+# 2. Опционально (ускорение записи JSON):
+pip install orjson
 
 # ИЛИ установить все сразу из файла:
 pip install -r requirements_script_loader.txt
\ No newline at end of file
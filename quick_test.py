@@ -6,18 +6,15 @@
 """
 
 import os
-from dotenv import load_dotenv
 
+from config import SCRIPT_FILE
 from script_loader import ScriptLoader
 
-load_dotenv(dotenv_path='.env')
-
 
 def quick_test():
     """Быстрый тест функциональности"""
 
-    # Получаем настройки из переменных окружения
-    script_file = os.getenv('SCRIPT_FILE')
+    script_file = SCRIPT_FILE
 
     print("БЫСТРЫЙ ТЕСТ ОБРАБОТЧИКА СЦЕНАРИЕВ")
     print("=" * 45)
@@ -33,6 +30,13 @@ def quick_test():
 
     # 2. Проверяем импорты
     print("\n2. Проверка зависимостей:")
+    try:
+        import fitz
+        print(f"PyMuPDF: {fitz.VersionBind}")
+    except ImportError:
+        print("PyMuPDF не установлен")
+        return False
+
     try:
         import PyPDF2
         print(f"PyPDF2: {PyPDF2.__version__}")
@@ -67,11 +71,11 @@ def quick_test():
     # 4. Быстрый тест извлечения текста
     print("\n4. Тест извлечения текста:")
     try:
-        # Извлекаем только первые 1000 символов для теста
-        with pdfplumber.open(script_file) as pdf:
-            if pdf.pages:
-                first_page = pdf.pages[0]
-                test_text = first_page.extract_text() or ""
+        # Извлекаем только первую страницу через PyMuPDF - основной
+        # извлекатель ScriptLoader
+        with fitz.open(script_file) as doc:
+            if doc.page_count:
+                test_text = doc[0].get_text("text")
                 print(
                     f"Текст извлечен (первая страница:"
                     f"{len(test_text)} символов)"
@@ -98,7 +102,7 @@ def quick_test():
 def show_file_info():
     """Показывает информацию о файле без обработки"""
 
-    script_file = "_ 1 СЕРИЯ_.pdf"
+    script_file = SCRIPT_FILE
 
     if not os.path.exists(script_file):
         print(f"Файл {script_file} не найден")
@@ -6,20 +6,18 @@
 import os
 import sys
 from pathlib import Path
-from dotenv import load_dotenv
 
+import config
 from script_loader import ScriptLoader
 
-load_dotenv(dotenv_path='.env')
-
 
 def main():
-    # Путь к тестовому файлу
-    script_file = os.getenv('SCRIPT_FILE')
-    output_format = os.getenv('OUTPUT_FORMAT')
-    output_dir = os.getenv('OUTPUT_DIR')
-    enable_logging = os.getenv('ENABLE_LOGGING')
-    verbose_output = os.getenv('VERBOSE_OUTPUT')
+    # Настройки из .env
+    script_file = config.SCRIPT_FILE
+    output_format = config.OUTPUT_FORMAT
+    output_dir = config.OUTPUT_DIR
+    enable_logging = config.ENABLE_LOGGING
+    verbose_output = config.VERBOSE_OUTPUT
 
     print("ЗАПУСК ОБРАБОТКИ СЦЕНАРИЯ")
     print("=" * 50)
@@ -82,17 +80,17 @@ def main():
             print("\nПЕРВЫЕ 3 СЦЕНЫ:")
             print("-" * 40)
 
-        for i, scene in enumerate(result['scenes'][:3]):
-            print(f"\nСцена {scene['number']}: {scene['title']}")
-            print(f"Локация: {scene['location']}")
-            print(f"Тип: {scene['metadata']['scene_type']}")
-            print(f"Строк в сцене: {scene['metadata']['line_count']}")
-            print(f"Слов в сцене: {scene['metadata']['word_count']}")
-            print(
-                f"Есть диалоги: {'Да' if scene['metadata']['has_dialogue'] else 'Нет'}")
-
-        if len(result['scenes']) > 3:
-            print(f"\n... и еще {len(result['scenes']) - 3} сцен")
+            for i, scene in enumerate(result['scenes'][:3]):
+                print(f"\nСцена {scene['number']}: {scene['title']}")
+                print(f"Локация: {scene['location']}")
+                print(f"Тип: {scene['metadata']['scene_type']}")
+                print(f"Строк в сцене: {scene['metadata']['line_count']}")
+                print(f"Слов в сцене: {scene['metadata']['word_count']}")
+                print(
+                    f"Есть диалоги: {'Да' if scene['metadata']['has_dialogue'] else 'Нет'}")
+
+            if len(result['scenes']) > 3:
+                print(f"\n... и еще {len(result['scenes']) - 3} сцен")
 
         # Показываем распределение по типам сцен
         scene_types = {}
@@ -6,18 +6,177 @@
 import os
 import re
 import json
+import hashlib
+import tempfile
+import zipfile
 import datetime
-import PyPDF2
-import pdfplumber
-from docx import Document
+import posixpath
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from typing import List, Dict, Any, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 import logging
 
+# Библиотеки разбора PDF/DOCX импортируются внутри методов-извлекателей,
+# чтобы импорт модуля не загружал их без необходимости
+
+# orjson опционален: без него используется стандартный json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Настройка логирования
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Предкомпилированные паттерны очистки текста
+_RE_SPACES = re.compile(r' +')
+_RE_PAGENUM = re.compile(r'^\d{1,4}$')
+_RE_HASLETTER = re.compile(r'[а-яёa-z]', re.IGNORECASE)
+
+# Локация в заголовке сцены
+_RE_LOCATION = re.compile(r'(INT\.|EXT\.|INT\/EXT\.)\s*([^-]+)', re.IGNORECASE)
+
+# Типы сцен в порядке проверки
+_SCENE_TYPE_PATTERNS = (
+    # INT. (интерьер) - может быть с пробелами, дефисами
+    (re.compile(r'\b(INT\.|ИНТ\.)', re.IGNORECASE), 'интерьер'),
+    # EXT. (экстерьер) - может быть с пробелами, дефисами
+    (re.compile(r'\b(EXT\.|ЭКСТ\.)', re.IGNORECASE), 'экстерьер'),
+    # Комбинированные варианты
+    (re.compile(
+        r'(INT\.\s*/\s*EXT\.|ИНТ\.\s*/\s*ЭКСТ\.|'
+        r'НАТ\s*/\s*ИНТ\.|INT\s*/\s*EXT)',
+        re.IGNORECASE
+    ), 'интерьер/экстерьер'),
+)
+
+# Пространства имен DOCX
+_W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_REL = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+_OFFICE_DOCUMENT = (
+    'http://schemas.openxmlformats.org/officeDocument/2006/relationships/'
+    'officeDocument'
+)
+
+# Текстовые эквиваленты служебных элементов run (как в python-docx)
+_DOCX_RUN_TEXT = {
+    _W + 'tab': '\t',
+    _W + 'ptab': '\t',
+    _W + 'cr': '\n',
+    _W + 'noBreakHyphen': '-',
+}
+
+# Начиная с этого числа страниц PDF разбирается в нескольких процессах
+PARALLEL_MIN_PAGES = 200
+
+
+def _extract_pdf_pages(file_path: str, start: int, stop: int) -> List[str]:
+    """
+    Извлечение текста диапазона страниц PDF (выполняется в процессе-воркере)
+
+    Args:
+        file_path: Путь к PDF файлу
+        start: Индекс первой страницы
+        stop: Индекс страницы после последней
+
+    Returns:
+        Тексты страниц
+    """
+    import fitz
+
+    with fitz.open(file_path) as doc:
+        return [doc[i].get_text("text") for i in range(start, stop)]
+
+
+def _json_dumps(obj: Any) -> str:
+    """
+    Сериализация в JSON с отступом 2 и без экранирования не-ASCII
+
+    Args:
+        obj: Сериализуемый объект
+
+    Returns:
+        JSON строка
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, indent=2)
+
+
+def _docx_run_text(run: ET.Element) -> str:
+    """
+    Текст элемента w:r
+
+    Args:
+        run: Элемент w:r
+
+    Returns:
+        Текст run с табуляциями и переносами строк
+    """
+    parts = []
+    for child in run:
+        tag = child.tag
+        if tag == _W + 't':
+            parts.append(child.text or '')
+        elif tag == _W + 'br':
+            if child.get(_W + 'type', 'textWrapping') == 'textWrapping':
+                parts.append('\n')
+        elif tag in _DOCX_RUN_TEXT:
+            parts.append(_DOCX_RUN_TEXT[tag])
+    return ''.join(parts)
+
+
+def _docx_paragraphs(file_path: str) -> List[str]:
+    """
+    Потоковое чтение абзацев тела DOCX без объектной модели python-docx
+
+    Как и Document.paragraphs, берет только абзацы верхнего уровня
+    (без таблиц) и текст их run и гиперссылок
+
+    Args:
+        file_path: Путь к DOCX файлу
+
+    Returns:
+        Тексты абзацев
+    """
+    with zipfile.ZipFile(file_path) as z:
+        # Основная часть документа указана в _rels/.rels
+        document_name = 'word/document.xml'
+        with z.open('_rels/.rels') as f:
+            for rel in ET.parse(f).getroot().iter(_REL + 'Relationship'):
+                if rel.get('Type') == _OFFICE_DOCUMENT:
+                    document_name = posixpath.normpath(
+                        rel.get('Target').lstrip('/')
+                    )
+                    break
+
+        parts = []
+        depth = 0
+        with z.open(document_name) as f:
+            for event, el in ET.iterparse(f, events=('start', 'end')):
+                if event == 'start':
+                    depth += 1
+                    continue
+                # w:document > w:body > элемент верхнего уровня
+                if depth == 3:
+                    if el.tag == _W + 'p':
+                        texts = []
+                        for child in el:
+                            if child.tag == _W + 'r':
+                                texts.append(_docx_run_text(child))
+                            elif child.tag == _W + 'hyperlink':
+                                texts.extend(
+                                    _docx_run_text(run)
+                                    for run in child.findall(_W + 'r')
+                                )
+                        parts.append(''.join(texts))
+                    el.clear()
+                depth -= 1
+        return parts
+
 
 @dataclass
 class Scene:
@@ -26,20 +185,43 @@ class Scene:
     title: str
     location: str
     content: str
-    raw_text: str
     metadata: Dict[str, Any]
 
+    @property
+    def raw_text(self) -> str:
+        """Полный текст сцены: заголовок и содержимое"""
+        return f"{self.title}\n{self.content}" if self.content else self.title
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Преобразование в словарь без глубокого копирования"""
+        return {
+            'number': self.number,
+            'title': self.title,
+            'location': self.location,
+            'content': self.content,
+            'metadata': self.metadata,
+        }
+
 
 class ScriptLoader:
     """Основной класс для загрузки и обработки сценариев"""
 
-    def __init__(self, scene_patterns: Optional[List[str]] = None):
+    # Версия формата результата; при изменении кэш становится недействительным
+    __version__ = '3'
+
+    def __init__(
+        self,
+        scene_patterns: Optional[List[str]] = None,
+        cache_dir: Optional[str] = os.path.join('.cache', 'scriptloader')
+    ):
         """
         Инициализация загрузчика сценариев
 
         Args:
             scene_patterns: Список паттернов для определения начала сцен
+            cache_dir: Папка кэша результатов (None - без кэша)
         """
+        self.cache_dir = cache_dir
         self.scene_patterns = scene_patterns or [
             r'^\s*(?:INT\.|EXT\.|INT\/EXT\.|FADE IN:|FADE OUT:)',
             r'^\s*\d+\.\s*',
@@ -50,6 +232,71 @@ class ScriptLoader:
             re.compile(pattern, re.IGNORECASE | re.MULTILINE)
             for pattern in self.scene_patterns
         ]
+        # Паттерны без групп объединяются в одну альтернацию, чтобы на
+        # каждую строку приходился один вызов match. С группами это
+        # невозможно: сдвинулись бы номера обратных ссылок и повторились
+        # бы имена групп, поэтому тогда паттерны проверяются по очереди
+        self._scene_re = None
+        if all(p.groups == 0 for p in self.compiled_patterns):
+            combined = "(?:" + ")|(?:".join(self.scene_patterns) + ")"
+            self._scene_re = re.compile(
+                combined, re.IGNORECASE | re.MULTILINE
+            )
+
+    def _line_matches(self, text: str, start: int, end: int) -> bool:
+        """
+        Проверка, является ли строка text[start:end] заголовком сцены
+
+        Args:
+            text: Текст
+            start: Начало строки
+            end: Конец строки (без перевода строки)
+
+        Returns:
+            True, если строку начинает один из паттернов сцен
+        """
+        if self._scene_re is not None:
+            return self._scene_re.match(text, start, end) is not None
+        return any(p.match(text, start, end) for p in self.compiled_patterns)
+
+    def _scene_starts(self, text: str) -> List[int]:
+        """
+        Поиск начал заголовков сцен за один проход по тексту
+
+        Args:
+            text: Очищенный текст
+
+        Returns:
+            Отсортированные позиции начал строк-заголовков
+        """
+        if self._scene_re is None:
+            # Паттерны с группами: проверяем каждую строку отдельно
+            starts = []
+            offset = 0
+            for line in text.split('\n'):
+                end = offset + len(line)
+                if self._line_matches(text, offset, end):
+                    starts.append(offset)
+                offset = end + 1
+            return starts
+
+        # Поиск идет по всему тексту, но \s в паттерне может захватить
+        # перевод строки, поэтому каждое совпадение перепроверяется
+        # в пределах своей строки, как при построчной проверке
+        starts = []
+        pos = 0
+        while True:
+            m = self._scene_re.search(text, pos)
+            if m is None:
+                break
+            line_start = text.rfind('\n', 0, m.start()) + 1
+            line_end = text.find('\n', m.start())
+            if line_end == -1:
+                line_end = len(text)
+            if self._line_matches(text, line_start, line_end):
+                starts.append(line_start)
+            pos = line_end + 1
+        return starts
 
     def extract_text_from_pdf(self, file_path: str) -> str:
         """
@@ -62,25 +309,54 @@ class ScriptLoader:
             Извлеченный текст
         """
         try:
-            # Попробуем сначала pdfplumber для лучшего качества
+            # Основной путь - PyMuPDF: быстрее и экономнее по памяти
+            import fitz
+
+            with fitz.open(file_path) as doc:
+                page_count = doc.page_count
+                workers = os.cpu_count() or 1
+                if page_count < PARALLEL_MIN_PAGES or workers < 2:
+                    parts = []
+                    for page in doc:
+                        parts.append(page.get_text("text"))
+                    return "\n".join(parts)
+
+            # Длинный документ: страницы разбираются диапазонами
+            # в отдельных процессах, каждый открывает файл сам
+            chunk = max(1, page_count // (4 * workers))
+            starts = range(0, page_count, chunk)
+            stops = [min(start + chunk, page_count) for start in starts]
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                chunks = executor.map(
+                    _extract_pdf_pages, repeat(file_path), starts, stops
+                )
+                parts = [text for texts in chunks for text in texts]
+            return "\n".join(parts)
+        except Exception as e:
+            logger.warning(f"PyMuPDF не удался: {e}, пробуем pdfplumber")
+
+        try:
+            # pdfplumber - для файлов, чувствительных к разметке
+            import pdfplumber
+
             with pdfplumber.open(file_path) as pdf:
-                text = ""
+                parts = []
                 for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
-                return text
+                    parts.append(page.extract_text() or "")
+                return "\n".join(parts)
         except Exception as e:
             logger.warning(f"pdfplumber не удался: {e}, пробуем PyPDF2")
 
             # Fallback на PyPDF2
             try:
+                import PyPDF2
+
                 with open(file_path, 'rb') as file:
                     pdf_reader = PyPDF2.PdfReader(file)
-                    text = ""
+                    parts = []
                     for page in pdf_reader.pages:
-                        text += page.extract_text() + "\n"
-                    return text
+                        parts.append(page.extract_text() or "")
+                    return "\n".join(parts)
             except Exception as e2:
                 logger.error(f"Ошибка извлечения текста из PDF: {e2}")
                 raise
@@ -96,11 +372,20 @@ class ScriptLoader:
             Извлеченный текст
         """
         try:
+            # Потоковый разбор word/document.xml
+            return "\n".join(_docx_paragraphs(file_path))
+        except Exception as e:
+            logger.warning(
+                f"Потоковый разбор DOCX не удался: {e}, пробуем python-docx")
+
+        try:
+            from docx import Document
+
             doc = Document(file_path)
-            text = ""
+            parts = []
             for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
-            return text
+                parts.append(paragraph.text)
+            return "\n".join(parts)
         except Exception as e:
             logger.error(f"Ошибка извлечения текста из DOCX: {e}")
             raise
@@ -115,24 +400,22 @@ class ScriptLoader:
         Returns:
             Очищенный текст
         """
-        # Удаление лишних пробелов и переносов строк
-        text = re.sub(r'\n\s*\n', '\n\n', text)  # Максимум 2 переноса строки
-        text = re.sub(r' +', ' ', text)  # Удаление лишних пробелов
-        text = text.strip()
+        # Удаление лишних пробелов
+        if '  ' in text:
+            text = _RE_SPACES.sub(' ', text)
 
-        # Удаление служебной информации (номера страниц, колонтитулы)
-        lines = text.split('\n')
+        # Удаление служебной информации (номера страниц, колонтитулы).
+        # Пустые строки отбрасываются фильтром коротких строк ниже,
+        # после него в тексте нет ни пустых строк, ни пробелов по краям
         cleaned_lines = []
 
-        for line in lines:
+        for line in text.splitlines():
             line = line.strip()
             # Пропускаем строки, которые выглядят как номера страниц
-            if re.match(r'^\d+$', line) and len(line) < 5:
+            if _RE_PAGENUM.match(line):
                 continue
             # Пропускаем очень короткие строки без букв
-            if len(line) < 3 and not re.search(
-                r'[а-яёa-z]', line, re.IGNORECASE
-            ):
+            if len(line) < 3 and not _RE_HASLETTER.search(line):
                 continue
             cleaned_lines.append(line)
 
@@ -143,41 +426,24 @@ class ScriptLoader:
         Сегментация текста на сцены
 
         Args:
-            text: Очищенный текст
+            text: Результат clean_text (строки без пробелов по краям)
 
         Returns:
             Список сцен
         """
-        lines = text.split('\n')
-        scenes = []
-        current_scene = []
-        scene_number = 1
-
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
+        # Один проход по всему тексту: позиции совпадений - границы сцен
+        starts = self._scene_starts(text)
+        # Пролог до первого заголовка становится отдельной сценой
+        if not starts or starts[0] != 0:
+            starts.insert(0, 0)
+        starts.append(len(text))
 
-            # Проверяем, является ли строка началом новой сцены
-            is_new_scene = False
-            for pattern in self.compiled_patterns:
-                if pattern.match(line):
-                    is_new_scene = True
-                    break
-
-            # Если это новая сцена и у нас есть содержимое предыдущей
-            if is_new_scene and current_scene:
-                scene = self._create_scene(current_scene, scene_number)
-                scenes.append(scene)
-                scene_number += 1
-                current_scene = [line]
-            else:
-                current_scene.append(line)
-
-        # Добавляем последнюю сцену
-        if current_scene:
-            scene = self._create_scene(current_scene, scene_number)
-            scenes.append(scene)
+        scenes = []
+        for i in range(len(starts) - 1):
+            block = text[starts[i]:starts[i + 1]]
+            lines = [line for line in block.split('\n') if line]
+            if lines:
+                scenes.append(self._create_scene(lines, len(scenes) + 1))
 
         return scenes
 
@@ -192,8 +458,6 @@ class ScriptLoader:
         Returns:
             Объект Scene
         """
-        raw_text = '\n'.join(lines)
-
         # Извлекаем заголовок (обычно первая строка)
         title = lines[0] if lines else ""
 
@@ -208,7 +472,6 @@ class ScriptLoader:
             title=title,
             location=location,
             content='\n'.join(lines[1:]) if len(lines) > 1 else "",
-            raw_text=raw_text,
             metadata=metadata
         )
 
@@ -223,8 +486,7 @@ class ScriptLoader:
             Название локации
         """
         # Ищем паттерны INT./EXT.
-        location_match = re.search(
-            r'(INT\.|EXT\.|INT\/EXT\.)\s*([^-]+)', title, re.IGNORECASE)
+        location_match = _RE_LOCATION.search(title)
         if location_match:
             return location_match.group(2).strip()
 
@@ -241,12 +503,18 @@ class ScriptLoader:
         Returns:
             Словарь с метаданными
         """
+        # Подсчет слов и поиск реплик за один проход по строкам
+        word_count = 0
+        has_dialogue = False
+        for line in lines:
+            word_count += len(line.split())
+            if not has_dialogue and len(line) < 50 and line.isupper():
+                has_dialogue = True
+
         metadata = {
             'line_count': len(lines),
-            'word_count': sum(len(line.split()) for line in lines),
-            'has_dialogue': any(
-                line.isupper() and len(line) < 50 for line in lines
-            ),
+            'word_count': word_count,
+            'has_dialogue': has_dialogue,
             'scene_type': self._determine_scene_type(lines)
         }
 
@@ -262,22 +530,12 @@ class ScriptLoader:
         Returns:
             Тип сцены
         """
-        title = lines[0].upper() if lines else ""
-
-        # Более гибкие паттерны для определения типа сцены
-        import re
+        title = lines[0] if lines else ""
 
-        # Ищем INT. (интерьер) - может быть с пробелами, дефисами
-        if re.search(r'\b(INT\.|ИНТ\.)', title):
-            return 'интерьер'
-        # Ищем EXT. (экстерьер) - может быть с пробелами, дефисами
-        elif re.search(r'\b(EXT\.|ЭКСТ\.)', title):
-            return 'экстерьер'
-        # Ищем комбинированные варианты
-        elif re.search(r'(INT\.\s*/\s*EXT\.|ИНТ\.\s*/\s*ЭКСТ\.|НАТ\s*/\s*ИНТ\.|INT\s*/\s*EXT)', title):
-            return 'интерьер/экстерьер'
-        else:
-            return 'неопределен'
+        for pattern, scene_type in _SCENE_TYPE_PATTERNS:
+            if pattern.search(title):
+                return scene_type
+        return 'неопределен'
 
     def load_script(self, file_path: str) -> Dict[str, Any]:
         """
@@ -289,19 +547,34 @@ class ScriptLoader:
         Returns:
             Словарь с результатами обработки
         """
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"Файл не найден: {file_path}")
+        # Один stat на весь вызов: проверка существования, размер, mtime
+        try:
+            st = os.stat(file_path)
+        except (FileNotFoundError, NotADirectoryError):
+            raise FileNotFoundError(f"Файл не найден: {file_path}") from None
 
+        # Выбираем извлекатель до чтения файла
         file_ext = os.path.splitext(file_path)[1].lower()
-
-        # Извлекаем текст в зависимости от формата
         if file_ext == '.pdf':
-            raw_text = self.extract_text_from_pdf(file_path)
+            extract_text = self.extract_text_from_pdf
         elif file_ext == '.docx':
-            raw_text = self.extract_text_from_docx(file_path)
+            extract_text = self.extract_text_from_docx
         else:
             raise ValueError(f"Неподдерживаемый формат файла: {file_ext}")
 
+        cache_path = (
+            self._cache_path(file_path, st) if self.cache_dir else None
+        )
+        if cache_path:
+            cached = self._read_cache(cache_path)
+            if cached is not None:
+                cached['file_info']['path'] = file_path
+                logger.info(f"Результат для {file_path} взят из кэша")
+                return cached
+
+        # Извлекаем текст в зависимости от формата
+        raw_text = extract_text(file_path)
+
         # Очищаем и структурируем текст
         cleaned_text = self.clean_text(raw_text)
 
@@ -313,21 +586,93 @@ class ScriptLoader:
             'file_info': {
                 'path': file_path,
                 'extension': file_ext,
-                'size': os.path.getsize(file_path)
+                'size': st.st_size
             },
             'text_info': {
                 'raw_length': len(raw_text),
                 'cleaned_length': len(cleaned_text),
                 'scene_count': len(scenes)
             },
-            'scenes': [asdict(scene) for scene in scenes],
-            'processed_at': str(datetime.datetime.now())
+            'scenes': [scene.to_dict() for scene in scenes],
+            'processed_at': datetime.datetime.now(
+                datetime.timezone.utc
+            ).isoformat()
         }
 
+        if cache_path:
+            self._write_cache(cache_path, result)
+
         logger.info(
             f"Обработан файл: {file_path}, найдено сцен: {len(scenes)}")
         return result
 
+    def _cache_path(self, file_path: str, st: os.stat_result) -> str:
+        """
+        Путь к файлу кэша для сценария
+
+        Ключ строится из содержимого файла, его mtime и размера,
+        версии класса и паттернов сцен
+
+        Args:
+            file_path: Путь к файлу сценария
+            st: Результат os.stat для файла
+
+        Returns:
+            Путь к JSON файлу кэша
+        """
+        h = hashlib.sha1()
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                h.update(chunk)
+        key = hashlib.sha1('\0'.join([
+            h.hexdigest(),
+            str(st.st_mtime_ns),
+            str(st.st_size),
+            self.__class__.__version__,
+            *self.scene_patterns,
+        ]).encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _read_cache(self, cache_path: str) -> Optional[Dict[str, Any]]:
+        """
+        Чтение результата из кэша
+
+        Args:
+            cache_path: Путь к файлу кэша
+
+        Returns:
+            Сохраненный результат или None, если кэша нет
+        """
+        if not os.path.exists(cache_path):
+            return None
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Не удалось прочитать кэш {cache_path}: {e}")
+            return None
+
+    def _write_cache(self, cache_path: str, result: Dict[str, Any]) -> None:
+        """
+        Атомарная запись результата в кэш
+
+        Args:
+            cache_path: Путь к файлу кэша
+            result: Результат обработки
+        """
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(result, f, ensure_ascii=False)
+                os.replace(tmp_path, cache_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.warning(f"Не удалось записать кэш {cache_path}: {e}")
+
     def save_to_json(self, data: Dict[str, Any], output_path: str) -> None:
         """
         Сохранение результатов в JSON файл
@@ -336,8 +681,22 @@ class ScriptLoader:
             data: Данные для сохранения
             output_path: Путь к выходному файлу
         """
+        # Списки (сцены) пишутся поэлементно, чтобы не держать в памяти
+        # JSON всего документа; вывод совпадает с json.dump(indent=2)
         with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+            f.write('{')
+            for i, (key, value) in enumerate(data.items()):
+                f.write(',\n  ' if i else '\n  ')
+                f.write(_json_dumps(key) + ': ')
+                if isinstance(value, list) and value:
+                    f.write('[')
+                    for j, item in enumerate(value):
+                        f.write(',\n    ' if j else '\n    ')
+                        f.write(_json_dumps(item).replace('\n', '\n    '))
+                    f.write('\n  ]')
+                else:
+                    f.write(_json_dumps(value).replace('\n', '\n  '))
+            f.write('\n}' if data else '}')
 
     def save_to_text(self, data: Dict[str, Any], output_path: str) -> None:
         """
@@ -347,55 +706,52 @@ class ScriptLoader:
             data: Данные для сохранения
             output_path: Путь к выходному файлу
         """
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write("АНАЛИЗ СЦЕНАРИЯ\n")
-            f.write("=" * 50 + "\n\n")
-
+        file_info = data.get('file_info', {})
+        text_info = data.get('text_info', {})
+        header = (
+            "АНАЛИЗ СЦЕНАРИЯ\n"
+            f"{'=' * 50}\n\n"
             # Информация о файле
-            file_info = data.get('file_info', {})
-            f.write(f"Файл: {file_info.get('path', 'Неизвестен')}\n")
-            f.write(f"Формат: {file_info.get('extension', 'Неизвестен')}\n")
-            f.write(f"Размер: {file_info.get('size', 0)} байт\n\n")
-
+            f"Файл: {file_info.get('path', 'Неизвестен')}\n"
+            f"Формат: {file_info.get('extension', 'Неизвестен')}\n"
+            f"Размер: {file_info.get('size', 0)} байт\n\n"
             # Статистика
-            text_info = data.get('text_info', {})
-            f.write("СТАТИСТИКА\n")
-            f.write("-" * 20 + "\n")
-            f.write(f"Количество сцен: {text_info.get('scene_count', 0)}\n")
-            f.write(
-                f"Символов в сыром тексте: {text_info.get('raw_length', 0)}\n")
-            f.write(
-                f"Символов в очищенном тексте:"
-                f"{text_info.get('cleaned_length', 0)}\n\n"
-            )
-
+            "СТАТИСТИКА\n"
+            f"{'-' * 20}\n"
+            f"Количество сцен: {text_info.get('scene_count', 0)}\n"
+            f"Символов в сыром тексте: {text_info.get('raw_length', 0)}\n"
+            f"Символов в очищенном тексте:"
+            f"{text_info.get('cleaned_length', 0)}\n\n"
             # Сцены
-            f.write("СЦЕНЫ\n")
-            f.write("=" * 20 + "\n\n")
+            "СЦЕНЫ\n"
+            f"{'=' * 20}\n\n"
+        )
+
+        # Каждая сцена собирается в одну строку и пишется одним вызовом
+        with open(output_path, 'w', encoding='utf-8',
+                  buffering=1024 * 1024) as f:
+            f.write(header)
 
             for scene_data in data.get('scenes', []):
-                f.write(f"СЦЕНА {scene_data.get('number', 0)}\n")
-                f.write("-" * 15 + "\n")
-                f.write(f"Заголовок: {scene_data.get('title', '')}\n")
-                f.write(f"Локация: {scene_data.get('location', '')}\n")
-                f.write(
-                    f"Тип: {scene_data.get('metadata', {}).get('scene_type', '')}\n")
-                f.write(
-                    f"Строк: {scene_data.get('metadata', {}).get('line_count', 0)}\n")
-                f.write(
-                    f"Слов: {scene_data.get('metadata', {}).get('word_count', 0)}\n")
-                f.write(
-                    f"Диалог: {'Да' if scene_data.get(
-                        'metadata',
-                        {}).get('has_dialogue') else 'Нет'}\n\n")
+                metadata = scene_data.get('metadata', {})
+                dialogue = 'Да' if metadata.get('has_dialogue') else 'Нет'
+                chunk = (
+                    f"СЦЕНА {scene_data.get('number', 0)}\n"
+                    f"{'-' * 15}\n"
+                    f"Заголовок: {scene_data.get('title', '')}\n"
+                    f"Локация: {scene_data.get('location', '')}\n"
+                    f"Тип: {metadata.get('scene_type', '')}\n"
+                    f"Строк: {metadata.get('line_count', 0)}\n"
+                    f"Слов: {metadata.get('word_count', 0)}\n"
+                    f"Диалог: {dialogue}\n\n"
+                )
 
                 # Содержимое сцены
                 content = scene_data.get('content', '')
                 if content:
-                    f.write("СОДЕРЖИМОЕ:\n")
-                    f.write(f"{content}\n\n")
+                    chunk += f"СОДЕРЖИМОЕ:\n{content}\n\n"
 
-                f.write(f"{'='*50}\n\n")
+                f.write(f"{chunk}{'=' * 50}\n\n")
 
 
 # Пример использования